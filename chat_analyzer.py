@@ -1,14 +1,192 @@
-import json
+import hashlib
+import orjson
 import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import seaborn as sns
-from datetime import datetime
 import numpy as np
-from collections import Counter
-import re
-import plotly.express as px
-import plotly.graph_objects as go
+
+try:
+    from numba import njit
+    from numba.core import types
+    from numba.typed import Dict
+except ImportError:
+    njit = None
+
+# Output columns of process_data and the value used when a JSON record omits one
+COLUMN_DEFAULTS = {
+    'user_id': 'Unknown',
+    'project_id': 'Unknown',
+    'session_id': 'Unknown',
+    'session_datetime': '',
+    'session_total_tokens': 0,
+    'source_file': 'Unknown',
+    'input_prompt': '',
+    'output_response': '',
+    'timestamp': '',
+    'input_tokens': 0,
+    'output_tokens': 0,
+    'total_tokens': 0
+}
+
+# Session-level JSON keys attached to every chat row, and the column each becomes
+SESSION_META_COLUMNS = {
+    'source_file': 'source_file',
+    'user_id': 'user_id',
+    'project_id': 'project_id',
+    'session_id': 'session_id',
+    'datetime': 'session_datetime',
+    'session_total_tokens': 'session_total_tokens'
+}
+
+# Part of the Parquet cache key; bump whenever the columns written by process_data change
+CACHE_FORMAT_VERSION = 1
+
+CATEGORY_COLUMNS = ['user_id', 'project_id', 'session_id', 'source_file']
+TEXT_COLUMNS = ['input_prompt', 'output_response']
+TOKEN_COLUMNS = ['input_tokens', 'output_tokens', 'total_tokens', 'session_total_tokens']
+
+# Common stop words left out of the word frequency analysis
+STOP_WORDS = frozenset({'the', 'and', 'to', 'of', 'a', 'in', 'is', 'that', 'it', 'on', 'you', 'for', 'i', 'with', 'as', 'at', 'this', 'but', 'be', 'are'})
+
+# Words as counted by the word frequency analysis, compiled once for every findall
+WORD_RE = re.compile(r'\b\w+\b')
+
+# Above this many characters of prompt text, words are counted by the Numba kernel
+NUMBA_WORD_COUNT_MIN_CHARS = 100 * 1024 * 1024
+
+# Web-resolution PNGs with fast zlib compression; encoding time grows with dpi squared
+SAVE_KWARGS = {'dpi': 120, 'bbox_inches': 'tight', 'pil_kwargs': {'compress_level': 1}}
+
+# Number of grid points the response length KDE is evaluated on
+KDE_GRID_SIZE = 1024
+
+if njit is not None:
+    @njit(cache=True)
+    def _count_word_hashes(buf, is_word):
+        """
+        Count the word runs in a UTF-8 buffer by FNV-1a hash, returning counts and first spans
+        """
+        counts = Dict.empty(types.uint64, types.int64)
+        starts = Dict.empty(types.uint64, types.int64)
+        ends = Dict.empty(types.uint64, types.int64)
+        n = len(buf)
+        i = 0
+        start = -1
+        h = np.uint64(14695981039346656037)
+        while i < n:
+            # Decode one code point so is_word can classify non-ASCII characters too
+            c = np.int64(buf[i])
+            if c < 0x80:
+                width, cp = 1, c
+            elif c < 0xE0:
+                width, cp = 2, ((c & 0x1F) << 6) | (np.int64(buf[i + 1]) & 0x3F)
+            elif c < 0xF0:
+                width, cp = 3, ((c & 0x0F) << 12) | ((np.int64(buf[i + 1]) & 0x3F) << 6) | (np.int64(buf[i + 2]) & 0x3F)
+            else:
+                width, cp = 4, (((c & 0x07) << 18) | ((np.int64(buf[i + 1]) & 0x3F) << 12)
+                                | ((np.int64(buf[i + 2]) & 0x3F) << 6) | (np.int64(buf[i + 3]) & 0x3F))
+            
+            if is_word[cp]:
+                if start < 0:
+                    start = i
+                    h = np.uint64(14695981039346656037)
+                for j in range(i, i + width):
+                    h = (h ^ np.uint64(buf[j])) * np.uint64(1099511628211)
+            elif start >= 0:
+                if h in counts:
+                    counts[h] += 1
+                else:
+                    counts[h] = 1
+                    starts[h] = start
+                    ends[h] = i
+                start = -1
+            i += width
+        
+        word_counts = np.empty(len(counts), np.int64)
+        word_starts = np.empty(len(counts), np.int64)
+        word_ends = np.empty(len(counts), np.int64)
+        k = 0
+        for h, count in counts.items():
+            word_counts[k] = count
+            word_starts[k] = starts[h]
+            word_ends[k] = ends[h]
+            k += 1
+        return word_counts, word_starts, word_ends
+
+_word_char_table = None
+
+def _word_chars():
+    """
+    Boolean lookup of the code points WORD_RE treats as word characters, built on first use
+    """
+    global _word_char_table
+    if _word_char_table is None:
+        _word_char_table = np.fromiter((chr(cp).isalnum() for cp in range(0x110000)), np.bool_, 0x110000)
+        _word_char_table[ord('_')] = True
+    return _word_char_table
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _hist1d(x, lo, hi, nbins):
+        """
+        Count values into nbins equal-width bins spanning [lo, hi]
+        """
+        hist = np.zeros(nbins, np.float64)
+        scale = nbins / (hi - lo)
+        for v in x:
+            i = int((v - lo) * scale)
+            if i == nbins:
+                i -= 1
+            if 0 <= i < nbins:
+                hist[i] += 1.0
+        return hist
+else:
+    def _hist1d(x, lo, hi, nbins):
+        """
+        Count values into nbins equal-width bins spanning [lo, hi]
+        """
+        return np.histogram(x, bins=nbins, range=(lo, hi))[0].astype(np.float64)
+
+def fft_kde(values, nbins=KDE_GRID_SIZE, cut=3):
+    """
+    Gaussian KDE on a regular grid by binning and one FFT convolution, using Scott's bandwidth
+    """
+    x = np.asarray(values, dtype=np.float64)
+    bw = x.std(ddof=1) * len(x) ** (-1 / 5) if len(x) > 1 else 0.0
+    if bw == 0:
+        return None, None
+    
+    lo, hi = x.min() - cut * bw, x.max() + cut * bw
+    dx = (hi - lo) / nbins
+    hist = _hist1d(x, lo, hi, nbins)
+    
+    k = min(int(np.ceil(4 * bw / dx)), nbins)
+    kernel = np.exp(-0.5 * (np.arange(-k, k + 1) * dx / bw) ** 2)
+    n = nbins + 2 * k
+    conv = np.fft.irfft(np.fft.rfft(hist, n) * np.fft.rfft(kernel, n), n)[k:k + nbins]
+    
+    grid = lo + (np.arange(nbins) + 0.5) * dx
+    return grid, np.clip(conv, 0, None) / (kernel.sum() * len(x) * dx)
+
+def word_frequencies(prompts):
+    """
+    Count the lowercase words in a Series of prompts, unsorted; take the top words with nlargest
+    """
+    prompts = prompts.astype('string[pyarrow]').str.lower()
+    if njit is None or prompts.str.len().sum() < NUMBA_WORD_COUNT_MIN_CHARS:
+        return prompts.str.findall(WORD_RE).explode().value_counts(sort=False)
+    
+    # Trailing space so the last word is closed inside the kernel
+    text = (' '.join(prompts.fillna('').tolist()) + ' ').encode('utf-8')
+    counts, starts, ends = _count_word_hashes(np.frombuffer(text, np.uint8), _word_chars())
+    words = [text[start:end].decode('utf-8', errors='replace') for start, end in zip(starts, ends)]
+    return pd.Series(counts, index=words, name='count')
 
 class ChatDataAnalyzer:
     def __init__(self, data_directory="./json_files"):
@@ -16,183 +194,161 @@ class ChatDataAnalyzer:
         Initialize the analyzer with directory containing JSON files
         """
         self.data_directory = data_directory
-        self.all_data = []
+        self.files_loaded = 0
         self.processed_df = None
+        self._file_groups = {}
+        self._cache_path = None
         self.output_base_dir = "visualization_outputs"
+
+        # Session records filled by _ingest, each tagged with its source file
+        self._sessions = []
         
     def load_json_files(self):
         """
         Load all JSON files from the specified directory
         """
-        json_files = [f for f in os.listdir(self.data_directory) if f.endswith('.json')]
+        # DirEntry.stat() is cached, and files too small to hold a JSON object are never opened
+        with os.scandir(self.data_directory) as it:
+            json_entries = [e for e in it if e.name.endswith('.json') and e.stat().st_size > 2]
         
-        for file_name in json_files:
-            file_path = os.path.join(self.data_directory, file_name)
+        for entry in json_entries:
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    data['source_file'] = file_name
-                    self.all_data.append(data)
-                print(f" Successfully loaded: {file_name}")
+                with open(entry.path, 'rb') as f:
+                    data = orjson.loads(f.read())
+                self._ingest(data, entry.name)
+                self.files_loaded += 1
             except Exception as e:
-                print(f" Error loading {file_name}: {e}")
+                print(f" Error loading {entry.name}: {e}")
         
-        print(f" Total files loaded: {len(self.all_data)}")
-        return self.all_data
+        print(f" Total files loaded: {self.files_loaded}")
+        return self.files_loaded
+
+    def _ingest(self, data, file_name):
+        """
+        Append the chat sessions of one parsed JSON file, tagged with its source file
+        """
+        # Built in full before extending, so a malformed file adds no sessions at all
+        sessions = [
+            {**chat_session, 'chat_data': chat_session.get('chat_data') or [], 'source_file': file_name}
+            for chat_session in data.get('chat_history', [])
+        ]
+        self._sessions.extend(sessions)
     
     def process_data(self):
         """
         Process all loaded JSON data into a structured DataFrame
         """
-        processed_rows = []
+        df = pd.json_normalize(
+            self._sessions,
+            record_path='chat_data',
+            meta=list(SESSION_META_COLUMNS),
+            meta_prefix='session.',
+            errors='ignore'
+        )
+        # Session-level fields win over chat records that happen to repeat them
+        df = df.drop(columns=list(SESSION_META_COLUMNS.values()), errors='ignore')
+        df = df.rename(columns={f'session.{key}': column for key, column in SESSION_META_COLUMNS.items()})
+        self.processed_df = df.reindex(columns=list(COLUMN_DEFAULTS)).fillna(COLUMN_DEFAULTS)
         
-        for session_data in self.all_data:
-            chat_history = session_data.get('chat_history', [])
-            
-            for chat_session in chat_history:
-                user_id = chat_session.get('user_id', 'Unknown')
-                project_id = chat_session.get('project_id', 'Unknown')
-                session_id = chat_session.get('session_id', 'Unknown')
-                session_datetime = chat_session.get('datetime', '')
-                session_total_tokens = chat_session.get('session_total_tokens', 0)
-                source_file = session_data.get('source_file', 'Unknown')
-                
-                for chat in chat_session.get('chat_data', []):
-                    row = {
-                        'user_id': user_id,
-                        'project_id': project_id,
-                        'session_id': session_id,
-                        'session_datetime': session_datetime,
-                        'session_total_tokens': session_total_tokens,
-                        'source_file': source_file,
-                        'input_prompt': chat.get('input_prompt', ''),
-                        'output_response': chat.get('output_response', ''),
-                        'timestamp': chat.get('timestamp', ''),
-                        'input_tokens': chat.get('input_tokens', 0),
-                        'output_tokens': chat.get('output_tokens', 0),
-                        'total_tokens': chat.get('total_tokens', 0)
-                    }
-                    processed_rows.append(row)
+        # here we need to Convert timestamps to datetime
+        self.processed_df[['timestamp', 'session_datetime']] = self.processed_df[['timestamp', 'session_datetime']].apply(
+            pd.to_datetime, format='ISO8601', utc=True, cache=True
+        )
+        # Free text lives in contiguous Arrow buffers so .str methods run as Arrow kernels
+        for column in TEXT_COLUMNS:
+            self.processed_df[column] = self.processed_df[column].astype('string[pyarrow]')
+        # Hour of day as a one-byte groupby key; nullable so unparsed timestamps stay missing
+        self.processed_df['_hour'] = self.processed_df['timestamp'].dt.hour.astype('Int8')
+        self.processed_df['_resp_len'] = self.processed_df['output_response'].str.len().fillna(0).astype('int32')
         
-        self.processed_df = pd.DataFrame(processed_rows)
+        # Low-cardinality identifiers become categoricals and token counts the smallest int type
+        # Cast to str first so mixed int/str IDs (e.g. 1 alongside 'Unknown') share one category type
+        for column in CATEGORY_COLUMNS:
+            self.processed_df[column] = self.processed_df[column].astype(str).astype('category')
+        self.processed_df[TOKEN_COLUMNS] = self.processed_df[TOKEN_COLUMNS].apply(pd.to_numeric, downcast='unsigned')
         
-        # here we need to Convert timestamps to datetime
-        self.processed_df['timestamp'] = pd.to_datetime(self.processed_df['timestamp'])
-        self.processed_df['session_datetime'] = pd.to_datetime(self.processed_df['session_datetime'])
+        self._index_file_groups()
         
         return self.processed_df
 
-    def create_visualizations(self, source_file):
+    def _index_file_groups(self):
         """
-        Create all visualizations for a specific JSON file
+        Record row positions per source file, so create_visualizations can gather instead of scanning
         """
-        # here we need to Create file-specific directory
-        file_dir = os.path.join(self.output_base_dir, os.path.splitext(source_file)[0])
-        os.makedirs(file_dir, exist_ok=True)
-        
-        # here we need to Filter data for this file
-        file_data = self.processed_df[self.processed_df['source_file'] == source_file]
-        
-        # 1. Multi-Session Interaction Frequency Over Time
-        plt.figure(figsize=(15, 8))
-        for session_id in file_data['session_id'].unique():
-            session_data = file_data[file_data['session_id'] == session_id]
-            hourly_interactions = session_data.groupby(session_data['timestamp'].dt.hour).size()
-            plt.plot(hourly_interactions.index, hourly_interactions.values, 
-                    marker='o', linestyle='-', label=f'Session {session_id}')
-        
-        plt.title('Interaction Frequency Over Time Across Sessions', fontsize=14, pad=20)
-        plt.xlabel('Hour of Day', fontsize=12)
-        plt.ylabel('Number of Interactions', fontsize=12)
-        plt.grid(True, linestyle='--', alpha=0.7)
-        plt.legend()
-        plt.savefig(os.path.join(file_dir, 'multi_session_interaction_frequency.png'), dpi=300, bbox_inches='tight')
-        plt.close()
-
-        # 2. Token Distribution Across Sessions
-        plt.figure(figsize=(12, 8))
-        session_tokens = file_data.groupby('session_id').agg({
-            'input_tokens': 'sum',
-            'output_tokens': 'sum'
-        })
-        
-        x = np.arange(len(session_tokens))
-        width = 0.35
-        
-        plt.bar(x - width/2, session_tokens['input_tokens'], width, label='Input Tokens', color='#3498db')
-        plt.bar(x + width/2, session_tokens['output_tokens'], width, label='Output Tokens', color='#e74c3c')
-        
-        plt.title('Token Distribution Across Sessions', fontsize=14, pad=20)
-        plt.xlabel('Session', fontsize=12)
-        plt.ylabel('Total Tokens', fontsize=12)
-        plt.xticks(x, [f'Session {sid}' for sid in session_tokens.index])
-        plt.legend()
-        plt.grid(True, linestyle='--', alpha=0.7)
-        plt.savefig(os.path.join(file_dir, 'multi_session_token_distribution.png'), dpi=300, bbox_inches='tight')
-        plt.close()
-
-        # 3. Most Common Words Analysis
-        plt.figure(figsize=(15, 8))
-        # Get all words and their frequencies
-        all_text = ' '.join(file_data['input_prompt'].astype(str))
-        words = re.findall(r'\b\w+\b', all_text.lower())
-        word_freq = Counter(words)
-        
-        # Remove common stop words
-        stop_words = {'the', 'and', 'to', 'of', 'a', 'in', 'is', 'that', 'it', 'on', 'you', 'for', 'i', 'with', 'as', 'at', 'this', 'but', 'be', 'are'}
-        for word in stop_words:
-            word_freq.pop(word, None)
-        
-        # Get top 20 most common words
-        common_words = word_freq.most_common(20)
-        words, counts = zip(*common_words)
-        
-        # Create horizontal bar chart
-        plt.barh(range(len(words)), counts, color='#3498db')
-        plt.yticks(range(len(words)), words)
-        plt.title('Top 20 Most Common Words Across All Sessions', fontsize=14, pad=20)
-        plt.xlabel('Frequency', fontsize=12)
-        plt.ylabel('Words', fontsize=12)
-        plt.grid(True, linestyle='--', alpha=0.7)
-        
-        # Add value labels on the bars
-        for i, count in enumerate(counts):
-            plt.text(count, i, f' {count}', va='center')
-        
-        plt.tight_layout()
-        plt.savefig(os.path.join(file_dir, 'common_words_analysis.png'), dpi=300, bbox_inches='tight')
-        plt.close()
-
-        # 4. Response Length Distribution
-        plt.figure(figsize=(15, 8))
-        for session_id in file_data['session_id'].unique():
-            session_data = file_data[file_data['session_id'] == session_id]
-            session_data['response_length'] = session_data['output_response'].str.len()
-            sns.kdeplot(data=session_data, x='response_length', label=f'Session {session_id}')
+        self._file_groups = self.processed_df.groupby('source_file', observed=True, sort=False).indices
+
+    def cache_path(self):
+        """
+        Path of the Parquet cache for the current JSON files, keyed by their names, mtimes and sizes
+        """
+        with os.scandir(self.data_directory) as it:
+            stats = sorted((e.name, e.stat().st_mtime_ns, e.stat().st_size) for e in it if e.name.endswith('.json'))
+        key = hashlib.blake2b(repr((CACHE_FORMAT_VERSION, stats)).encode(), digest_size=16).hexdigest()
+        return os.path.join(self.output_base_dir, f'_cache_{key}.parquet')
+
+    def load_cache(self):
+        """
+        Load processed_df from the Parquet cache if the JSON files are unchanged since it was written
+        """
+        # Keyed once, before parsing, so a file edited mid-run cannot be saved under its new key
+        self._cache_path = cache_path = self.cache_path()
+        if not os.path.exists(cache_path):
+            return False
         
-        plt.title('Response Length Distribution Across Sessions', fontsize=14, pad=20)
-        plt.xlabel('Response Length (characters)', fontsize=12)
-        plt.ylabel('Density', fontsize=12)
-        plt.grid(True, linestyle='--', alpha=0.7)
-        plt.legend()
-        plt.savefig(os.path.join(file_dir, 'multi_session_response_length.png'), dpi=300, bbox_inches='tight')
-        plt.close()
-
-        # 5. Session Comparison Heatmap
-        plt.figure(figsize=(15, 8))
-        hourly_activity = file_data.groupby([
-            file_data['timestamp'].dt.hour,
-            file_data['session_id']
-        ]).size().unstack(fill_value=0)
+        try:
+            self.processed_df = pd.read_parquet(cache_path, engine='pyarrow')
+        except Exception as e:
+            # e.g. a cache truncated by a crash; drop it and fall back to parsing the JSON
+            print(f" ⚠️  Ignoring unreadable cache {cache_path}: {e}")
+            try:
+                os.remove(cache_path)
+            except OSError:
+                pass
+            return False
+        self._index_file_groups()
+        print(f" Loaded processed data from cache: {cache_path}")
+        return True
+
+    def save_cache(self):
+        """
+        Write processed_df to the Parquet cache for the JSON files keyed by load_cache, replacing older caches
+        """
+        cache_path = self._cache_path or self.cache_path()
+        # Written next to the final path and renamed into place, so an interrupted write never leaves a partial cache
+        tmp_path = f'{cache_path}.{os.getpid()}.tmp'
+        try:
+            os.makedirs(self.output_base_dir, exist_ok=True)
+            self.processed_df.to_parquet(tmp_path, compression='zstd', engine='pyarrow')
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            # The cache only saves time on the next run, so failing to write it is not fatal
+            print(f" ⚠️  Could not write cache {cache_path}: {e}")
+            return
+        finally:
+            try:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+            except OSError:
+                pass
         
-        sns.heatmap(hourly_activity, cmap='YlOrRd', cbar_kws={'label': 'Number of Interactions'})
-        plt.title('Activity Heatmap: Hour vs Session', fontsize=14, pad=20)
-        plt.xlabel('Session ID', fontsize=12)
-        plt.ylabel('Hour of Day', fontsize=12)
-        plt.savefig(os.path.join(file_dir, 'session_activity_heatmap.png'), dpi=300, bbox_inches='tight')
-        plt.close()
+        # Older caches, and temp files left behind by killed runs; a leftover file is harmless
+        try:
+            with os.scandir(self.output_base_dir) as it:
+                stale = [e.path for e in it if e.name.startswith('_cache_') and e.name.endswith(('.parquet', '.tmp'))
+                         and e.path != cache_path]
+            for path in stale:
+                try:
+                    os.remove(path)
+                except OSError as e:
+                    print(f" ⚠️  Could not remove old cache {path}: {e}")
+        except OSError as e:
+            print(f" ⚠️  Could not clean up old caches in {self.output_base_dir}: {e}")
 
-        print(f"✅ Created visualizations for {source_file} in {file_dir}")
+    def create_visualizations(self, source_file):
+        """
+        Create all visualizations for a specific JSON file
+        """
+        create_visualizations(source_file, self.processed_df.take(self._file_groups[source_file]), self.output_base_dir)
 
     def generate_summary_report(self):
         """
@@ -214,25 +370,122 @@ class ChatDataAnalyzer:
         print(f"   • Average Tokens per Interaction: {avg_tokens_per_interaction:.2f}")
         
         print(f"\n🔍 File Breakdown:")
-        for source_file in self.processed_df['source_file'].unique():
-            file_data = self.processed_df[self.processed_df['source_file'] == source_file]
-            print(f"\n   • File: {source_file}")
-            print(f"     - Sessions: {file_data['session_id'].nunique()}")
-            print(f"     - Total Interactions: {len(file_data)}")
-            print(f"     - Total Tokens: {file_data['total_tokens'].sum():,}")
-            print(f"     - Average Response Length: {file_data['output_response'].str.len().mean():.0f} characters")
+        file_summary = self.processed_df.groupby('source_file', observed=True, sort=False).agg(
+            sessions=('session_id', 'nunique'),
+            interactions=('session_id', 'size'),
+            tokens=('total_tokens', 'sum'),
+            avg_len=('_resp_len', 'mean')
+        )
+        for row in file_summary.itertuples():
+            print(f"\n   • File: {row.Index}")
+            print(f"     - Sessions: {row.sessions}")
+            print(f"     - Total Interactions: {row.interactions}")
+            print(f"     - Total Tokens: {row.tokens:,}")
+            print(f"     - Average Response Length: {row.avg_len:.0f} characters")
         
         print(f"\n⏰ Time Analysis:")
-        busiest_hour = self.processed_df.groupby(self.processed_df['timestamp'].dt.hour).size().idxmax()
+        busiest_hour = self.processed_df['_hour'].value_counts(sort=False).sort_index().idxmax()
         print(f"   • Busiest Hour: {busiest_hour}:00")
         
         print(f"\n📝 Top Topics (Most Common Words):")
-        all_text = ' '.join(self.processed_df['input_prompt'].astype(str))
-        words = re.findall(r'\b\w+\b', all_text.lower())
-        common_words = Counter(words).most_common(5)
-        for word, count in common_words:
+        common_words = word_frequencies(self.processed_df['input_prompt']).nlargest(5)
+        for word, count in common_words.items():
             print(f"   • '{word}': {count} times")
 
+def create_visualizations(source_file, file_data, output_base_dir):
+    """
+    Create all visualizations for the rows of a single JSON file
+    """
+    # here we need to Create file-specific directory
+    file_dir = os.path.join(output_base_dir, os.path.splitext(source_file)[0])
+    os.makedirs(file_dir, exist_ok=True)
+    
+    # Interactions per hour and session, shared by the line plot and the heatmap
+    hourly_activity = file_data.groupby(['_hour', 'session_id'], observed=True).size().unstack(fill_value=0)
+    
+    # One figure is reused for every plot and cleared in between
+    fig, ax = plt.subplots(figsize=(15, 8))
+    
+    # 1. Multi-Session Interaction Frequency Over Time
+    for session_id in hourly_activity.columns:
+        ax.plot(hourly_activity.index, hourly_activity[session_id].values,
+                marker='o', linestyle='-', label=f'Session {session_id}')
+    
+    ax.set_title('Interaction Frequency Over Time Across Sessions', fontsize=14, pad=20)
+    ax.set_xlabel('Hour of Day', fontsize=12)
+    ax.set_ylabel('Number of Interactions', fontsize=12)
+    ax.grid(True, linestyle='--', alpha=0.7)
+    ax.legend()
+    fig.savefig(os.path.join(file_dir, 'multi_session_interaction_frequency.png'), **SAVE_KWARGS)
+    ax.cla()
+
+    # 2. Token Distribution Across Sessions
+    fig.set_size_inches(12, 8)
+    session_tokens = file_data.groupby('session_id', observed=True).agg({
+        'input_tokens': 'sum',
+        'output_tokens': 'sum'
+    })
+    
+    session_tokens.columns = ['Input Tokens', 'Output Tokens']
+    session_tokens.plot.bar(ax=ax, width=0.8, color=['#3498db', '#e74c3c'], rasterized=True)
+    
+    ax.set_title('Token Distribution Across Sessions', fontsize=14, pad=20)
+    ax.set_xlabel('Session', fontsize=12)
+    ax.set_ylabel('Total Tokens', fontsize=12)
+    ax.set_xticklabels([f'Session {sid}' for sid in session_tokens.index], rotation=0)
+    ax.legend()
+    ax.grid(True, linestyle='--', alpha=0.7)
+    fig.savefig(os.path.join(file_dir, 'multi_session_token_distribution.png'), **SAVE_KWARGS)
+    ax.cla()
+
+    # 3. Most Common Words Analysis
+    fig.set_size_inches(15, 8)
+    # Get all words and their frequencies, without common stop words
+    word_freq = word_frequencies(file_data['input_prompt'])
+    
+    # Get top 20 most common words
+    common_words = word_freq.drop(labels=STOP_WORDS, errors='ignore').nlargest(20)
+    words, counts = common_words.index, common_words.values
+    
+    # Create horizontal bar chart
+    ax.barh(range(len(words)), counts, color='#3498db', rasterized=True)
+    ax.set_yticks(range(len(words)), words)
+    ax.set_title('Top 20 Most Common Words Across All Sessions', fontsize=14, pad=20)
+    ax.set_xlabel('Frequency', fontsize=12)
+    ax.set_ylabel('Words', fontsize=12)
+    ax.grid(True, linestyle='--', alpha=0.7)
+    
+    # Add value labels on the bars
+    for i, count in enumerate(counts):
+        ax.text(count, i, f' {count}', va='center')
+    
+    fig.savefig(os.path.join(file_dir, 'common_words_analysis.png'), **SAVE_KWARGS)
+    ax.cla()
+
+    # 4. Response Length Distribution
+    for session_id, response_lengths in file_data.groupby('session_id', observed=True)['_resp_len']:
+        grid, density = fft_kde(response_lengths.to_numpy())
+        if grid is not None:
+            ax.plot(grid, density, label=f'Session {session_id}')
+    
+    ax.set_title('Response Length Distribution Across Sessions', fontsize=14, pad=20)
+    ax.set_xlabel('Response Length (characters)', fontsize=12)
+    ax.set_ylabel('Density', fontsize=12)
+    ax.grid(True, linestyle='--', alpha=0.7)
+    ax.legend()
+    fig.savefig(os.path.join(file_dir, 'multi_session_response_length.png'), **SAVE_KWARGS)
+    ax.cla()
+
+    # 5. Session Comparison Heatmap
+    sns.heatmap(hourly_activity, cmap='YlOrRd', cbar_kws={'label': 'Number of Interactions'}, rasterized=True, ax=ax)
+    ax.set_title('Activity Heatmap: Hour vs Session', fontsize=14, pad=20)
+    ax.set_xlabel('Session ID', fontsize=12)
+    ax.set_ylabel('Hour of Day', fontsize=12)
+    fig.savefig(os.path.join(file_dir, 'session_activity_heatmap.png'), **SAVE_KWARGS)
+    plt.close(fig)
+
+    print(f"✅ Created visualizations for {source_file} in {file_dir}")
+
 def main():
     """
     Main function to run the complete analysis
@@ -255,18 +508,22 @@ def main():
         print("Please add your JSON files to this directory and run again.")
         return
     
-    # Load and process data
-    analyzer.load_json_files()
-    if not analyzer.all_data:
-        print("❌ No data loaded. Exiting.")
-        return
-        
-    analyzer.process_data()
+    # Load and process data, unless the cache already holds it for these files
+    if not analyzer.load_cache():
+        if not analyzer.load_json_files():
+            print("❌ No data loaded. Exiting.")
+            return
+            
+        analyzer.process_data()
+        analyzer.save_cache()
     
     # Generate visualizations for each file
     print("\n🎨 Generating visualizations...")
-    for source_file in analyzer.processed_df['source_file'].unique():
-        analyzer.create_visualizations(source_file)
+    # Files are independent, so each one is plotted in its own worker process
+    source_files = list(analyzer._file_groups)
+    file_frames = (analyzer.processed_df.take(analyzer._file_groups[sf]) for sf in source_files)
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        list(executor.map(create_visualizations, source_files, file_frames, repeat(analyzer.output_base_dir)))
     
     # Generate summary report
     analyzer.generate_summary_report()